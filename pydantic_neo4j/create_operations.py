@@ -28,75 +28,26 @@ class CreateUtilities:
         else:
             return class_
 
-    @staticmethod
-    async def get_create_node_string(model: object, node_prefix: str = "n") -> str:
-        query = f"CREATE ({node_prefix}:{model.__class__.__name__}"
-        criteria = DatabaseOperations.get_node_criteria_string(criteria=model.__dict__)
-        if criteria != "":
-            query += f" {{{criteria} }}"
-        query += f") RETURN {node_prefix}"
-        return query
-
-    @staticmethod
-    def get_create_relationship_string(
-        start_node: NodeModel,
-        end_node: NodeModel,
-        relationship: RelationshipModel,
-        query_term: str = "CREATE",
-    ) -> str:
-        start_node_prefix = "start_node"
-        end_node_prefix = "end_node"
-        relationship_prefix = "link"
-
-        relationship_criteria = relationship.get_fields()
-
-        query = DatabaseOperations.get_cypher_node_match_string(
-            model=start_node.__class__,
-            node_prefix=start_node_prefix,
-            with_return=False,
-            criteria={"graph_id": start_node.graph_id},
-        )
-        query += DatabaseOperations.get_cypher_node_match_string(
-            model=end_node.__class__,
-            node_prefix=end_node_prefix,
-            with_return=False,
-            criteria={"graph_id": end_node.graph_id},
-        )
-        criteria = DatabaseOperations.get_relationship_criteria_string(
-            criteria=relationship_criteria
-        )
-        query += f"{query_term}({start_node_prefix}) - [{relationship_prefix}: {relationship.__class__.__name__}"
-        if criteria != "":
-            query += f" {{ {criteria} }}"
-        arrow = "->" if relationship.is_directional else "-"
-        query += f"]{arrow}({end_node_prefix}) RETURN {start_node_prefix}, {end_node_prefix}, {relationship_prefix}"
-
-        return query
-
     async def create_node(self, model: NodeModel) -> NodeModel:
-        # todo: add merge functionality
-        # query_term = 'MERGE' if merge else 'CREATE'
-        existing_node = await self.match_utilities.node_query(
-            node_name=model.__class__.__name__, criteria=model.get_required_fields()
-        )
+        query, parameters = model.get_match_required_query()
+        existing_node = await self.match_utilities.run_model_query(model, query, parameters)
 
         if len(existing_node) > 0:
             raise neo4j.exceptions.ClientError(f"Node already exists: {existing_node}")
         else:
-            query = await self.get_create_node_string(model=model)
-            eager_result = await self.database_operations.run_query(query)
+            query, parameters = model.get_create_query()
+            eager_result = await self.database_operations.run_query(
+                query, parameters=DatabaseOperations.get_query_parameters(parameters)
+            )
             result = eager_result.records[0].data()
-            return self.str_to_class(model=model.__class__, **result["n"])
+            return self.str_to_class(model=model.__class__, **result[model.get_plan().return_prefix])
 
     async def match_or_create_node(
         self, model: NodeModel
     ) -> tuple[uuid.UUID, NodeModel]:
 
-        existing_node = await self.match_utilities.node_query(
-            node_name=model.__class__.__name__,
-            criteria=model.get_required_fields(),
-            statement="MATCH",
-        )
+        query, parameters = model.get_match_required_query()
+        existing_node = await self.match_utilities.run_model_query(model, query, parameters)
 
         if len(existing_node) == 0:
             new_node = await self.create_node(model=model)
@@ -109,7 +60,21 @@ class CreateUtilities:
         else:
             raise neo4j.exceptions.ClientError(f"Multiple nodes found: {model}")
 
+    async def merge_model(self, model: Neo4jModel) -> Neo4jModel:
+        """Match the model on graph_id, creating it if it does not exist"""
+        query, parameters = model.get_merge_query()
+        eager_result = await self.database_operations.run_query(
+            query, parameters=DatabaseOperations.get_query_parameters(parameters)
+        )
+        models = self.match_utilities.get_result_models(model, eager_result)
+        if len(models) == 0:
+            raise neo4j.exceptions.ClientError(f"Merge returned no results, are the nodes created: {model}")
+        return models[0]
+
     async def create_relationship(self, relationship: RelationshipModel):
+        if relationship.start_node is None or relationship.end_node is None:
+            raise ValueError("Each relationship must have a start and end node")
+
         start_node_id, start_node = await self.match_or_create_node(
             model=relationship.start_node
         )
@@ -117,15 +82,10 @@ class CreateUtilities:
             model=relationship.end_node
         )
 
-        rel_exists = await self.match_utilities.relationship_query(
-            start_node_name=start_node.__class__.__name__,
-            start_criteria={"graph_id": start_node_id},
-            end_node_name=end_node.__class__.__name__,
-            end_criteria={"graph_id": end_node_id},
-            relationship_name=relationship.__class__.__name__,
-            relationship_criteria=relationship.get_required_fields(),
+        query, parameters = relationship.get_match_required_query(
+            start_node=start_node, end_node=end_node
         )
-        #print(rel_exists)
+        rel_exists = await self.match_utilities.run_model_query(relationship, query, parameters)
 
         if len(rel_exists) > 0:
             # todo: make new exceptions
@@ -133,13 +93,12 @@ class CreateUtilities:
                 f"Relationship already exists: {rel_exists}"
             )
         else:
-            # todo: make new model based on the search results
-
-            query = self.get_create_relationship_string(
-                start_node=start_node, end_node=end_node, relationship=relationship
+            query, parameters = relationship.get_create_query(
+                start_node=start_node, end_node=end_node
+            )
+            created_results = await self.database_operations.run_query(
+                query, parameters=DatabaseOperations.get_query_parameters(parameters)
             )
-            #print(query)
-            created_results = await self.database_operations.run_query(query)
 
             return created_results
 
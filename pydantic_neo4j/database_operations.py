@@ -65,6 +65,20 @@ class DatabaseOperations:
 
         return value
 
+    @staticmethod
+    def convert_parameter(value: Any) -> Any:
+        """Convert values to the form they are stored in when passed as query parameters"""
+        if type(value) == uuid.UUID:
+            return str(value)
+        if type(value) == datetime.datetime:
+            return str(value)
+
+        return value
+
+    @staticmethod
+    def get_query_parameters(parameters: dict) -> dict:
+        return {key: DatabaseOperations.convert_parameter(value) for key, value in parameters.items()}
+
     @staticmethod
     def get_node_criteria_string(
             criteria: dict, string_type: str = "attr", prefix: str = ""
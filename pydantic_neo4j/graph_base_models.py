@@ -1,14 +1,31 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional, Dict, Union, Any
+from typing import Optional, Dict, Union, Any, ClassVar, get_args
 
 from pydantic import BaseModel, Field, ConfigDict
 import uuid
 
 
+class Neo4jModelPlan(BaseModel):
+    """Field and query layout of a Neo4jModel class, compiled once on first use.
+    Templates are str.format strings, relationship templates take {arrow}, {start_label} and {end_label}"""
+    model_config = ConfigDict(frozen=True)
+    label: str
+    required_fields: tuple[str, ...] = ()
+    identifying_fields: tuple[str, ...] = ()
+    property_fields: tuple[str, ...] = ()
+    parameters: Dict[str, str] = Field(default_factory=dict)
+    return_prefix: str = ""
+    match_template: str = ""
+    match_required_template: str = ""
+    merge_template: str = ""
+    create_template: str = ""
+
+
 class Neo4jModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
+    __neo4j_plan__: ClassVar[Optional[Neo4jModelPlan]] = None
     graph_id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4)
     active: Optional[bool] = Field(default=True)
     version: int = Field(default=1)
@@ -20,33 +37,174 @@ class Neo4jModel(BaseModel):
     )
 
     def __eq__(self, other):
-        return self.node_id == other.node_id
+        if not isinstance(other, Neo4jModel):
+            return NotImplemented
+        if self.graph_id is None or other.graph_id is None:
+            return self is other
+        return self.graph_id == other.graph_id and self.get_plan().label == other.get_plan().label
+
+    def __hash__(self):
+        # graph_id is mutable, don't change it while the model is in a set or used as a dict key
+        if self.graph_id is None:
+            return id(self)
+        return hash((self.get_plan().label, self.graph_id))
+
+    @classmethod
+    def compile_plan(cls) -> Neo4jModelPlan:
+        required_fields = []
+        nullable_fields = []
+        identifying_fields = []
+        property_fields = []
+        for field, value in cls.model_fields.items():
+            if field == "start_node" or field == "end_node":
+                continue
+            property_fields.append(field)
+            if value.is_required():
+                required_fields.append(field)
+                if cls.is_nullable(value.annotation):
+                    nullable_fields.append(field)
+            if value.annotation == uuid.UUID or value.annotation == Optional[uuid.UUID]:
+                identifying_fields.append(field)
+
+        parameters = {field: field for field in property_fields}
+        templates = cls.get_cypher_templates(
+            label=cls.__name__,
+            parameters=parameters,
+            required_fields=[field for field in required_fields if field not in nullable_fields],
+            nullable_fields=nullable_fields,
+        )
+        return Neo4jModelPlan(
+            label=cls.__name__,
+            required_fields=tuple(required_fields),
+            identifying_fields=tuple(identifying_fields),
+            property_fields=tuple(property_fields),
+            parameters=parameters,
+            **templates,
+        )
+
+    @classmethod
+    def get_plan(cls) -> Neo4jModelPlan:
+        plan = cls.__dict__.get("__neo4j_plan__")
+        if plan is None:
+            plan = cls.compile_plan()
+            cls.__neo4j_plan__ = plan
+        return plan
+
+    @classmethod
+    def get_cypher_templates(
+            cls,
+            label: str,
+            parameters: Dict[str, str],
+            required_fields: list[str],
+            nullable_fields: list[str],
+    ) -> Dict[str, str]:
+        """Return the plan's return_prefix and query templates for the model
+        required_fields: required fields that can't be None, matched in the pattern map
+        nullable_fields: required fields that may be None, only matched when a value is given"""
+        return {}
+
+    @staticmethod
+    def is_nullable(annotation: Any) -> bool:
+        return annotation is Any or annotation is None or type(None) in get_args(annotation)
+
+    @staticmethod
+    def get_map_string(parameters: Dict[str, str], fields: Optional[list[str]] = None) -> str:
+        """Cypher map of properties to parameters, braces escaped for str.format"""
+        if fields is None:
+            fields = list(parameters)
+        if not fields:
+            return ""
+        properties = ", ".join(f"{field}: ${parameters[field]}" for field in fields)
+        return f" {{{{{properties}}}}}"
+
+    @staticmethod
+    def get_where_string(prefix: str, parameters: Dict[str, str], fields: list[str]) -> str:
+        """None values don't constrain the match, as with get_node_criteria_string"""
+        if not fields:
+            return ""
+        conditions = " AND ".join(
+            f"(${parameters[field]} IS NULL OR {prefix}.{field} = ${parameters[field]})"
+            for field in fields
+        )
+        return f" WHERE {conditions}"
+
+    @staticmethod
+    def get_set_string(prefix: str, parameters: Dict[str, str]) -> str:
+        assignments = [
+            f"{prefix}.{field} = ${parameter}"
+            for field, parameter in parameters.items()
+            if field != "graph_id"
+        ]
+        if not assignments:
+            return ""
+        return " ON CREATE SET " + ", ".join(assignments)
 
     def get_required_fields(self) -> Dict[str, Any]:
         """Fields needed for minimum compatibility between create and match modules"""
-        fields = {}
-        for field, value in self.__class__.model_fields.items():
-            if value.is_required() and field != "start_node" and field != "end_node":
-                fields[field] = getattr(self, field)
-        return fields
+        return {field: getattr(self, field) for field in self.get_plan().required_fields}
 
     def get_identifying_fields(self) -> Dict[str, Union[uuid.UUID]]:
-        fields = {}
-        for field, value in self.__class__.model_fields.items():
-            if value.annotation == uuid.UUID or value.annotation == Optional[uuid.UUID]:
-                fields[field] = getattr(self, field)
-        return fields
+        return {field: getattr(self, field) for field in self.get_plan().identifying_fields}
+
+    def get_parameters(self) -> Dict[str, Any]:
+        """Query parameters for the plan templates, keyed by parameter name"""
+        return {
+            parameter: getattr(self, field)
+            for field, parameter in self.get_plan().parameters.items()
+        }
+
+    def get_query(self, template: str) -> tuple[str, Dict[str, Any]]:
+        if template == "":
+            raise ValueError(f"{self.get_plan().label} has no compiled query template")
+        return template.format(arrow="->"), self.get_parameters()
+
+    def get_match_query(self, **kwargs) -> tuple[str, Dict[str, Any]]:
+        """Match on graph_id"""
+        return self.get_query(self.get_plan().match_template, **kwargs)
+
+    def get_match_required_query(self, **kwargs) -> tuple[str, Dict[str, Any]]:
+        """Match on the required fields, used to find existing entities before creating"""
+        return self.get_query(self.get_plan().match_required_template, **kwargs)
+
+    def get_merge_query(self, **kwargs) -> tuple[str, Dict[str, Any]]:
+        return self.get_query(self.get_plan().merge_template, **kwargs)
+
+    def get_create_query(self, **kwargs) -> tuple[str, Dict[str, Any]]:
+        return self.get_query(self.get_plan().create_template, **kwargs)
 
     def get_version_str(self) -> str:
         return f"v{self.version}"
 
 
 class NodeModel(Neo4jModel):
+    @classmethod
+    def get_cypher_templates(
+            cls,
+            label: str,
+            parameters: Dict[str, str],
+            required_fields: list[str],
+            nullable_fields: list[str],
+    ) -> Dict[str, str]:
+        prefix = "n"
+        id_string = cls.get_map_string(parameters, ["graph_id"])
+        node_string = f"({prefix}:{label}{id_string})"
+        return {
+            "return_prefix": prefix,
+            "match_template": f"MATCH {node_string} RETURN {prefix}",
+            "match_required_template": (
+                f"MATCH ({prefix}:{label}{cls.get_map_string(parameters, required_fields)})"
+                f"{cls.get_where_string(prefix, parameters, nullable_fields)} RETURN {prefix}"
+            ),
+            "merge_template": (
+                f"MERGE {node_string}{cls.get_set_string(prefix, parameters)} RETURN {prefix}"
+            ),
+            "create_template": (
+                f"CREATE ({prefix}:{label}{cls.get_map_string(parameters)}) RETURN {prefix}"
+            ),
+        }
+
     def get_fields(self) -> Dict[str, Any]:
-        fields = {}
-        for field, value in self.__class__.model_fields.items():
-            fields[field] = getattr(self, field)
-        return fields
+        return {field: getattr(self, field) for field in self.get_plan().property_fields}
 
 
 class RelationshipModel(Neo4jModel):
@@ -54,12 +212,70 @@ class RelationshipModel(Neo4jModel):
     start_node: Optional[NodeModel]
     end_node: Optional[NodeModel]
 
+    @classmethod
+    def get_cypher_templates(
+            cls,
+            label: str,
+            parameters: Dict[str, str],
+            required_fields: list[str],
+            nullable_fields: list[str],
+    ) -> Dict[str, str]:
+        prefix = "link"
+        # field names can't start with an underscore, so the endpoint parameters never collide
+        start_string = "(start_node:{start_label} {{graph_id: $_start_node_graph_id}})"
+        end_string = "(end_node:{end_label} {{graph_id: $_end_node_graph_id}})"
+        id_link_string = f"[{prefix}:{label}{cls.get_map_string(parameters, ['graph_id'])}]"
+        return_string = f" RETURN start_node, end_node, {prefix}"
+        return {
+            "return_prefix": prefix,
+            "match_template": (
+                f"MATCH {start_string}-{id_link_string}{{arrow}}{end_string}{return_string}"
+            ),
+            # existing relationships are looked up in either direction
+            "match_required_template": (
+                f"MATCH {start_string}-"
+                f"[{prefix}:{label}{cls.get_map_string(parameters, required_fields)}]-"
+                f"{end_string}{cls.get_where_string(prefix, parameters, nullable_fields)}"
+                f"{return_string}"
+            ),
+            "merge_template": (
+                f"MATCH {start_string} MATCH {end_string} "
+                f"MERGE (start_node)-{id_link_string}{{arrow}}(end_node)"
+                f"{cls.get_set_string(prefix, parameters)}{return_string}"
+            ),
+            "create_template": (
+                f"MATCH {start_string} MATCH {end_string} "
+                f"CREATE (start_node)-[{prefix}:{label}{cls.get_map_string(parameters)}]{{arrow}}(end_node)"
+                f"{return_string}"
+            ),
+        }
+
     def get_fields(self) -> Dict[str, Any]:
-        fields = {}
-        for field, value in self.__class__.model_fields.items():
-            if field != "start_node" and field != "end_node":
-                fields[field] = getattr(self, field)
-        return fields
+        return {field: getattr(self, field) for field in self.get_plan().property_fields}
+
+    def get_query(
+            self,
+            template: str,
+            start_node: Optional[NodeModel] = None,
+            end_node: Optional[NodeModel] = None,
+    ) -> tuple[str, Dict[str, Any]]:
+        """start_node and end_node default to the relationship's own nodes"""
+        if template == "":
+            raise ValueError(f"{self.get_plan().label} has no compiled query template")
+        start_node = start_node if start_node is not None else self.start_node
+        end_node = end_node if end_node is not None else self.end_node
+        if start_node is None or end_node is None:
+            raise ValueError("Each relationship must have a start and end node")
+
+        query = template.format(
+            arrow="->" if self.is_directional else "-",
+            start_label=start_node.get_plan().label,
+            end_label=end_node.get_plan().label,
+        )
+        parameters = self.get_parameters()
+        parameters["_start_node_graph_id"] = start_node.graph_id
+        parameters["_end_node_graph_id"] = end_node.graph_id
+        return query, parameters
 
 
 class RelationshipQueryModel(BaseModel):
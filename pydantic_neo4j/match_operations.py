@@ -1,12 +1,13 @@
 import uuid
 from datetime import datetime
 
-from typing import Union, Type
+from typing import Optional, Union, Type
 import neo4j
 from pydantic import create_model
 
 from .database_operations import DatabaseOperations, NeoObjectType
-from .graph_base_models import (NodeModel,
+from .graph_base_models import (Neo4jModel,
+                                NodeModel,
                                 RelationshipModel,
                                 SequenceNodeModel,
                                 SequenceQueryModel, SequenceCriteriaModel, SequenceCriteriaRelationshipModel,
@@ -106,32 +107,73 @@ class MatchUtilities:
             sequence_query_string = sequence_query_string[:-2]
         return sequence_query_string
 
-    def get_node_model(self, element: neo4j.graph.Node) -> Union[NodeModel | None]:
+    def get_node_model(self,
+                       element: neo4j.graph.Node,
+                       node_cache: Optional[dict[str, NodeModel]] = None
+                       ) -> Union[NodeModel | None]:
+        """Build a node model from a neo4j node.
+        node_cache: map of element id to model, shared across a result so each node is only built once"""
+        if node_cache is not None and element.element_id in node_cache:
+            return node_cache[element.element_id]
 
         labels = [label for label in element.labels]
         model_spec = self.get_model_spec(element)
 
         model = create_model(labels[0], __base__=NodeModel, **model_spec)
-        return model(**dict(element))
+        node = model(**dict(element))
+        if node_cache is not None:
+            node_cache[element.element_id] = node
+        return node
 
     def get_relationship_model(
-            self, element: neo4j.graph.Relationship
+            self,
+            element: neo4j.graph.Relationship,
+            node_cache: Optional[dict[str, NodeModel]] = None
     ) -> RelationshipModel:
         model_spec = self.get_model_spec(element)
         # model_spec = {key: (type(value), ...) for key, value in element.items()}
         start_node = None
         end_node = None
         if element.start_node is not None:
-            start_node = self.get_node_model(element.start_node)
+            start_node = self.get_node_model(element.start_node, node_cache)
             model_spec["start_node"] = (start_node.__class__, ...)
         if element.end_node is not None:
-            end_node = self.get_node_model(element.end_node)
+            end_node = self.get_node_model(element.end_node, node_cache)
             model_spec["end_node"] = (end_node.__class__, ...)
 
         label = element.type
         model = create_model(label, __base__=RelationshipModel, **model_spec)
         return model(start_node=start_node, end_node=end_node, **dict(element))
 
+    def get_result_models(self, model: Neo4jModel, eager_result: neo4j.EagerResult) -> list[Neo4jModel]:
+        """Hydrate the elements returned under the model's plan prefix"""
+        return_prefix = model.get_plan().return_prefix
+        node_cache = {}
+        models = []
+        for record in eager_result.records:
+            element = record[return_prefix]
+            if isinstance(element, neo4j.graph.Node):
+                models.append(self.get_node_model(element, node_cache))
+            else:
+                models.append(self.get_relationship_model(element, node_cache))
+        return models
+
+    async def run_model_query(self,
+                              model: Neo4jModel,
+                              query: str,
+                              parameters: dict
+                              ) -> dict[uuid.UUID, Neo4jModel]:
+        """Run a query built from the model's plan and hydrate the results"""
+        eager_result = await self.database_operations.run_query(
+            query, parameters=DatabaseOperations.get_query_parameters(parameters)
+        )
+        return {result.graph_id: result for result in self.get_result_models(model, eager_result)}
+
+    async def model_query(self, model: Neo4jModel) -> dict[uuid.UUID, Neo4jModel]:
+        """Match the model on graph_id using its compiled plan"""
+        query, parameters = model.get_match_query()
+        return await self.run_model_query(model, query, parameters)
+
     async def node_query(
             self,
             node_name: str = "",
@@ -145,6 +187,7 @@ class MatchUtilities:
         )
         node_query = self.get_node_prefix(node_name, node_prefix)
         node_models = {}
+        node_cache = {}
 
         query = f"{statement} ({node_query} {criteria_string})"
         if with_return:
@@ -152,7 +195,7 @@ class MatchUtilities:
 
         eager_result = await self.database_operations.run_query(query)
         for record in eager_result.records:
-            node = self.get_node_model(record[node_prefix])
+            node = self.get_node_model(record[node_prefix], node_cache)
             node_models[node.graph_id] = node
 
         return node_models
@@ -163,6 +206,7 @@ class MatchUtilities:
 
         rel_models = {}
         node_models = {}
+        node_cache = {}
         if (
                 len(sequence_query.node_sequence)
                 - len(sequence_query.relationship_sequence)
@@ -177,7 +221,7 @@ class MatchUtilities:
             for element in record:
                 if type(element) == neo4j.graph.Node:
                     try:
-                        node_model = self.get_node_model(element)
+                        node_model = self.get_node_model(element, node_cache)
                         if node_model.graph_id not in node_models:
                             node_models[node_model.graph_id] = node_model
 
@@ -187,7 +231,7 @@ class MatchUtilities:
                     pass
                 else:
                     try:
-                        rel_model = self.get_relationship_model(element)
+                        rel_model = self.get_relationship_model(element, node_cache)
                         if rel_model.graph_id not in rel_models:
                             rel_models[rel_model.graph_id] = rel_model
                     except Exception as e:
@@ -222,13 +266,14 @@ class MatchUtilities:
 
         eager_result = await self.database_operations.run_query(sequence_query_string)
         rel_models = {}
+        node_cache = {}
         for record in eager_result.records:
             for element in record:
 
                 if type(element) != neo4j.graph.Node and type(element) != neo4j.graph.Path:
 
                     try:
-                        rel_model = self.get_relationship_model(element)
+                        rel_model = self.get_relationship_model(element, node_cache)
                         if rel_model.graph_id not in rel_models:
                             rel_models[rel_model.graph_id] = rel_model
                     except Exception as e:
@@ -0,0 +1,59 @@
+import uuid
+
+from neo4j.graph import Graph, Node, Relationship
+
+
+def make_node(graph: Graph, element_id: str, label: str, **properties) -> Node:
+    properties.setdefault("graph_id", str(uuid.uuid4()))
+    properties.setdefault("created_at", "2023-08-01 12:00:00")
+    properties.setdefault("updated_at", "2023-08-01 12:00:00")
+    return Node(graph, element_id, 0, [label], properties)
+
+
+def make_relationship(graph: Graph,
+                      element_id: str,
+                      relationship_type: str,
+                      start_node: Node,
+                      end_node: Node,
+                      **properties) -> Relationship:
+    """Build a relationship the way the driver's hydrator does"""
+    properties.setdefault("graph_id", str(uuid.uuid4()))
+    properties.setdefault("created_at", "2023-08-01 12:00:00")
+    properties.setdefault("updated_at", "2023-08-01 12:00:00")
+    relationship = graph.relationship_type(relationship_type)(graph, element_id, 0, properties)
+    relationship._start_node = start_node
+    relationship._end_node = end_node
+    return relationship
+
+
+class FakeRecord:
+    """Stands in for a neo4j.Record, iterates over its values like the driver's records"""
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data.values())
+
+    def data(self) -> dict:
+        return self._data
+
+
+class FakeResult:
+    def __init__(self, records: list):
+        self.records = records
+
+
+class FakeDatabaseOperations:
+    """Records queries and replies with queued results"""
+
+    def __init__(self, results: list):
+        self.results = results
+        self.queries = []
+
+    async def run_query(self, query: str, **kwargs):
+        self.queries.append((query, kwargs))
+        return self.results.pop(0)
@@ -0,0 +1,80 @@
+import unittest
+from typing import Optional
+
+import neo4j
+from neo4j.graph import Graph
+
+from pydantic_neo4j import NodeModel, RelationshipModel
+from pydantic_neo4j.create_operations import CreateUtilities
+from pydantic_neo4j.graph_base_models import Neo4jModel
+from pydantic_neo4j.match_operations import MatchUtilities
+from .fakes import FakeDatabaseOperations, FakeRecord, FakeResult, make_node
+
+
+class Person(NodeModel):
+    name: str
+
+
+class Knows(RelationshipModel):
+    pass
+
+
+class Account(NodeModel):
+    nickname: Optional[str]
+    code: str
+
+
+def get_create_utilities(results: list) -> CreateUtilities:
+    database_operations = FakeDatabaseOperations(results)
+    return CreateUtilities(database_operations=database_operations,
+                           match_utilities=MatchUtilities(database_operations=database_operations))
+
+
+class TestCreateOperations(unittest.IsolatedAsyncioTestCase):
+
+    async def test_create_node_uses_plan_queries(self):
+        person = Person(name="Ada")
+        create_utilities = get_create_utilities(
+            [FakeResult([]), FakeResult([FakeRecord({"n": person.model_dump()})])]
+        )
+        created = await create_utilities.create_node(person)
+
+        (match_query, match_kwargs), (create_query, create_kwargs) = create_utilities.database_operations.queries
+        self.assertEqual(match_query, "MATCH (n:Person {name: $name}) RETURN n")
+        self.assertEqual(create_query, person.get_create_query()[0])
+        self.assertEqual(create_kwargs["parameters"]["graph_id"], str(person.graph_id))
+        self.assertEqual(created, person)
+
+    async def test_create_node_ignores_none_required_fields(self):
+        account = Account(nickname=None, code="a")
+        existing = FakeRecord({"n": make_node(Graph(), "4:db:1", "Account", code="a")})
+        create_utilities = get_create_utilities([FakeResult([existing])])
+        with self.assertRaises(neo4j.exceptions.ClientError):
+            await create_utilities.create_node(account)
+
+        (query, kwargs), = create_utilities.database_operations.queries
+        self.assertEqual(query, "MATCH (n:Account {code: $code}) WHERE ($nickname IS NULL OR n.nickname = $nickname) "
+                                "RETURN n")
+        self.assertIsNone(kwargs["parameters"]["nickname"])
+        self.assertEqual(kwargs["parameters"]["code"], "a")
+
+    async def test_create_relationship_requires_nodes(self):
+        create_utilities = get_create_utilities([])
+        with self.assertRaises(ValueError):
+            await create_utilities.create_relationship(Knows(start_node=Person(name="Ada"), end_node=None))
+        self.assertEqual(create_utilities.database_operations.queries, [])
+
+    async def test_merge_without_results_raises(self):
+        create_utilities = get_create_utilities([FakeResult([])])
+        knows = Knows(start_node=Person(name="Ada"), end_node=Person(name="Bob"))
+        with self.assertRaises(neo4j.exceptions.ClientError):
+            await create_utilities.merge_model(knows)
+
+    async def test_model_query_without_templates_raises(self):
+        class Plain(Neo4jModel):
+            pass
+
+        create_utilities = get_create_utilities([])
+        with self.assertRaises(ValueError):
+            await create_utilities.match_utilities.model_query(Plain())
+        self.assertEqual(create_utilities.database_operations.queries, [])
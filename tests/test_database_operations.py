@@ -0,0 +1,27 @@
+import datetime
+import unittest
+import uuid
+
+from pydantic_neo4j.database_operations import DatabaseOperations
+
+
+class TestQueryParameters(unittest.TestCase):
+
+    def test_uuid_and_datetime_converted_to_strings(self):
+        graph_id = uuid.uuid4()
+        created_at = datetime.datetime(2023, 8, 1, 12, 30, 15, 123456)
+        parameters = DatabaseOperations.get_query_parameters(
+            {"graph_id": graph_id, "created_at": created_at, "name": "Ada", "version": 1, "active": None}
+        )
+        self.assertEqual(parameters, {
+            "graph_id": str(graph_id),
+            "created_at": "2023-08-01 12:30:15.123456",
+            "name": "Ada",
+            "version": 1,
+            "active": None,
+        })
+
+    def test_parameters_match_inlined_values(self):
+        graph_id = uuid.uuid4()
+        self.assertEqual(f"'{DatabaseOperations.convert_parameter(graph_id)}'",
+                         DatabaseOperations.convert_value(graph_id))
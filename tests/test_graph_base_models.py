@@ -0,0 +1,204 @@
+import unittest
+import uuid
+from typing import Optional
+
+from pydantic_neo4j import NodeModel, RelationshipModel
+from pydantic_neo4j.graph_base_models import Neo4jModel
+
+
+class Person(NodeModel):
+    name: str
+
+
+class Company(NodeModel):
+    name: str
+
+
+class WorksAt(RelationshipModel):
+    role: str
+
+
+class Knows(RelationshipModel):
+    pass
+
+
+class TestModelPlan(unittest.TestCase):
+
+    def test_node_plan_fields(self):
+        plan = Person.get_plan()
+        self.assertEqual(plan.label, "Person")
+        self.assertEqual(plan.required_fields, ("name",))
+        self.assertEqual(plan.identifying_fields, ("graph_id",))
+        self.assertEqual(plan.property_fields,
+                         ("graph_id", "active", "version", "created_at", "updated_at", "name"))
+        self.assertEqual(plan.parameters["name"], "name")
+
+    def test_relationship_plan_fields(self):
+        plan = WorksAt.get_plan()
+        self.assertEqual(plan.label, "WorksAt")
+        self.assertEqual(plan.required_fields, ("role",))
+        self.assertEqual(plan.identifying_fields, ("graph_id",))
+        self.assertEqual(plan.property_fields,
+                         ("graph_id", "active", "version", "created_at", "updated_at",
+                          "is_directional", "role"))
+
+    def test_plan_is_compiled_per_class(self):
+        self.assertIs(Person.get_plan(), Person.get_plan())
+        self.assertIsNot(Person.get_plan(), Company.get_plan())
+
+    def test_plan_is_compiled_on_first_use(self):
+        class Lazy(NodeModel):
+            name: str
+
+        self.assertNotIn("__neo4j_plan__", Lazy.__dict__)
+        plan = Lazy.get_plan()
+        self.assertIs(Lazy.__dict__["__neo4j_plan__"], plan)
+
+    def test_nullable_required_fields_match_only_when_set(self):
+        class Account(NodeModel):
+            nickname: Optional[str]
+            code: str
+
+        plan = Account.get_plan()
+        self.assertEqual(plan.required_fields, ("nickname", "code"))
+        query, _ = Account(nickname=None, code="a").get_match_required_query()
+        self.assertEqual(query, "MATCH (n:Account {code: $code}) "
+                                "WHERE ($nickname IS NULL OR n.nickname = $nickname) RETURN n")
+
+    def test_model_helpers_use_plan(self):
+        person = Person(name="Ada")
+        self.assertEqual(person.get_required_fields(), {"name": "Ada"})
+        self.assertEqual(person.get_identifying_fields(), {"graph_id": person.graph_id})
+        works_at = WorksAt(role="cto", start_node=person, end_node=Company(name="Acme"))
+        self.assertNotIn("start_node", works_at.get_fields())
+        self.assertNotIn("end_node", works_at.get_fields())
+
+
+class TestCypherTemplates(unittest.TestCase):
+
+    def test_node_queries(self):
+        person = Person(name="Ada")
+        query, parameters = person.get_match_query()
+        self.assertEqual(query, "MATCH (n:Person {graph_id: $graph_id}) RETURN n")
+        self.assertEqual(parameters["graph_id"], person.graph_id)
+
+        query, _ = person.get_match_required_query()
+        self.assertEqual(query, "MATCH (n:Person {name: $name}) RETURN n")
+
+        query, _ = person.get_merge_query()
+        self.assertEqual(
+            query,
+            "MERGE (n:Person {graph_id: $graph_id}) ON CREATE SET n.active = $active, "
+            "n.version = $version, n.created_at = $created_at, n.updated_at = $updated_at, "
+            "n.name = $name RETURN n",
+        )
+
+        query, _ = person.get_create_query()
+        self.assertEqual(
+            query,
+            "CREATE (n:Person {graph_id: $graph_id, active: $active, version: $version, "
+            "created_at: $created_at, updated_at: $updated_at, name: $name}) RETURN n",
+        )
+
+    def test_directional_relationship_queries(self):
+        person = Person(name="Ada")
+        company = Company(name="Acme")
+        works_at = WorksAt(role="cto", start_node=person, end_node=company)
+
+        query, parameters = works_at.get_match_query()
+        self.assertEqual(
+            query,
+            "MATCH (start_node:Person {graph_id: $_start_node_graph_id})"
+            "-[link:WorksAt {graph_id: $graph_id}]->"
+            "(end_node:Company {graph_id: $_end_node_graph_id}) "
+            "RETURN start_node, end_node, link",
+        )
+        self.assertEqual(parameters["_start_node_graph_id"], person.graph_id)
+        self.assertEqual(parameters["_end_node_graph_id"], company.graph_id)
+
+        query, _ = works_at.get_merge_query()
+        self.assertEqual(
+            query,
+            "MATCH (start_node:Person {graph_id: $_start_node_graph_id}) "
+            "MATCH (end_node:Company {graph_id: $_end_node_graph_id}) "
+            "MERGE (start_node)-[link:WorksAt {graph_id: $graph_id}]->(end_node) "
+            "ON CREATE SET link.active = $active, link.version = $version, "
+            "link.created_at = $created_at, link.updated_at = $updated_at, "
+            "link.is_directional = $is_directional, link.role = $role "
+            "RETURN start_node, end_node, link",
+        )
+
+    def test_undirected_relationship_queries(self):
+        knows = Knows(is_directional=False, start_node=Person(name="Ada"), end_node=Person(name="Bob"))
+
+        query, _ = knows.get_match_query()
+        self.assertEqual(
+            query,
+            "MATCH (start_node:Person {graph_id: $_start_node_graph_id})"
+            "-[link:Knows {graph_id: $graph_id}]-"
+            "(end_node:Person {graph_id: $_end_node_graph_id}) "
+            "RETURN start_node, end_node, link",
+        )
+
+        query, _ = knows.get_merge_query()
+        self.assertIn("MERGE (start_node)-[link:Knows {graph_id: $graph_id}]-(end_node)", query)
+
+    def test_relationship_required_query_has_no_empty_map(self):
+        knows = Knows(start_node=Person(name="Ada"), end_node=Person(name="Bob"))
+        query, _ = knows.get_match_required_query()
+        self.assertIn("-[link:Knows]-", query)
+
+    def test_endpoint_parameters_do_not_collide_with_fields(self):
+        class Link(RelationshipModel):
+            start_node_graph_id: str
+
+        person = Person(name="Ada")
+        link = Link(start_node_graph_id="field", start_node=person, end_node=Person(name="Bob"))
+        _, parameters = link.get_match_query()
+        self.assertEqual(parameters["start_node_graph_id"], "field")
+        self.assertEqual(parameters["_start_node_graph_id"], person.graph_id)
+
+    def test_relationship_node_overrides(self):
+        works_at = WorksAt(role="cto", start_node=Person(name="Ada"), end_node=Company(name="Acme"))
+        matched = Person(name="Ada")
+        query, parameters = works_at.get_create_query(start_node=matched)
+        self.assertEqual(parameters["_start_node_graph_id"], matched.graph_id)
+        self.assertIn("CREATE (start_node)-[link:WorksAt {", query)
+
+    def test_relationship_without_nodes_raises(self):
+        works_at = WorksAt(role="cto", start_node=Person(name="Ada"), end_node=None)
+        with self.assertRaises(ValueError):
+            works_at.get_match_query()
+
+    def test_model_without_templates_raises(self):
+        class Plain(Neo4jModel):
+            pass
+
+        with self.assertRaises(ValueError):
+            Plain().get_match_query()
+
+
+class TestEquality(unittest.TestCase):
+
+    def test_equal_by_graph_id(self):
+        person = Person(name="Ada")
+        copy = Person(name="Other", graph_id=person.graph_id)
+        self.assertEqual(person, copy)
+        self.assertEqual(hash(person), hash(copy))
+        self.assertEqual(len({person, copy}), 1)
+        self.assertNotEqual(person, Person(name="Ada"))
+
+    def test_different_labels_not_equal(self):
+        graph_id = uuid.uuid4()
+        self.assertNotEqual(Person(name="Ada", graph_id=graph_id), Company(name="Ada", graph_id=graph_id))
+
+    def test_none_graph_id(self):
+        person = Person(name="Ada", graph_id=None)
+        other = Person(name="Ada", graph_id=None)
+        self.assertEqual(person, person)
+        self.assertNotEqual(person, other)
+        self.assertNotEqual(person, Knows(graph_id=None, start_node=None, end_node=None))
+        self.assertEqual(len({person, other}), 2)
+
+    def test_not_equal_to_other_types(self):
+        self.assertNotEqual(Person(name="Ada"), "Ada")
@@ -0,0 +1,89 @@
+import unittest
+
+from neo4j.graph import Graph
+
+from pydantic_neo4j import (SequenceCriteriaNodeModel,
+                            SequenceCriteriaRelationshipModel,
+                            SequenceQueryModel)
+from pydantic_neo4j.match_operations import MatchUtilities
+from .fakes import FakeDatabaseOperations, FakeRecord, FakeResult, make_node, make_relationship
+
+
+def get_fan_out_graph():
+    """A hub node with a relationship to each of three leaf nodes"""
+    graph = Graph()
+    hub = make_node(graph, "4:db:0", "Manufacturer", name="Acme")
+    leaves = [make_node(graph, f"4:db:{i}", "Design", color=f"red{i}") for i in range(1, 4)]
+    relationships = [
+        make_relationship(graph, f"5:db:{i}", "Produces", hub, leaf, design_revision=i)
+        for i, leaf in enumerate(leaves, start=1)
+    ]
+    return hub, leaves, relationships
+
+
+class TestNodeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.match_utilities = MatchUtilities(database_operations=FakeDatabaseOperations([]))
+
+    def test_relationships_share_start_node(self):
+        hub, leaves, relationships = get_fan_out_graph()
+        node_cache = {}
+        rel_models = [self.match_utilities.get_relationship_model(relationship, node_cache)
+                      for relationship in relationships]
+
+        self.assertIs(rel_models[0].start_node, rel_models[1].start_node)
+        self.assertIs(rel_models[1].start_node, rel_models[2].start_node)
+        self.assertEqual(len(node_cache), 1 + len(leaves))
+        self.assertIs(node_cache[hub.element_id], rel_models[0].start_node)
+
+    def test_node_model_reused_from_cache(self):
+        hub, _, relationships = get_fan_out_graph()
+        node_cache = {}
+        node = self.match_utilities.get_node_model(hub, node_cache)
+        rel_model = self.match_utilities.get_relationship_model(relationships[0], node_cache)
+        self.assertIs(rel_model.start_node, node)
+
+    def test_without_cache_nodes_are_rebuilt(self):
+        _, _, relationships = get_fan_out_graph()
+        first = self.match_utilities.get_relationship_model(relationships[0])
+        second = self.match_utilities.get_relationship_model(relationships[1])
+        self.assertIsNot(first.start_node, second.start_node)
+        self.assertEqual(first.start_node, second.start_node)
+
+
+class TestQueryNodeSharing(unittest.IsolatedAsyncioTestCase):
+
+    async def test_sequence_query_shares_nodes(self):
+        hub, leaves, relationships = get_fan_out_graph()
+        records = [FakeRecord({"m": hub, "p": relationship, "d": leaf})
+                   for relationship, leaf in zip(relationships, leaves)]
+        match_utilities = MatchUtilities(database_operations=FakeDatabaseOperations([FakeResult(records)]))
+        sequence_query = SequenceQueryModel(
+            node_sequence=[SequenceCriteriaNodeModel(name="Manufacturer", include_with_return=True),
+                           SequenceCriteriaNodeModel(name="Design", include_with_return=True)],
+            relationship_sequence=[SequenceCriteriaRelationshipModel(name="Produces", include_with_return=True)],
+        )
+
+        result = await match_utilities.sequence_query(sequence_query)
+
+        self.assertEqual(len(result.nodes), 1 + len(leaves))
+        self.assertEqual(len(result.relationships), len(relationships))
+        hub_model = result.nodes[hub["graph_id"]]
+        for rel_model in result.relationships.values():
+            self.assertIs(rel_model.start_node, hub_model)
+            self.assertIs(rel_model.end_node, result.nodes[rel_model.end_node.graph_id])
+
+    async def test_relationship_query_shares_nodes(self):
+        hub, leaves, relationships = get_fan_out_graph()
+        records = [FakeRecord({"m": hub, "p": relationship, "d": leaf})
+                   for relationship, leaf in zip(relationships, leaves)]
+        match_utilities = MatchUtilities(database_operations=FakeDatabaseOperations([FakeResult(records)]))
+
+        rel_models = await match_utilities.relationship_query(start_node_name="Manufacturer",
+                                                              end_node_name="Design",
+                                                              relationship_name="Produces")
+
+        self.assertEqual(len(rel_models), len(relationships))
+        start_nodes = {id(rel_model.start_node) for rel_model in rel_models.values()}
+        self.assertEqual(len(start_nodes), 1)